@@ -0,0 +1,14 @@
+# Default profiling parameters. Kept free of heavy imports so the CLI can
+# show them in --help without loading pandas.
+
+# Rows of sample data shown to the LLM per analysis
+DEFAULT_SAMPLE_ROWS = 10
+
+# Rows of sample data used for the table summary
+DEFAULT_SUMMARY_ROWS = 50
+
+# Distinct values per column shown to the LLM for unusual value detection
+DEFAULT_MAX_DISTINCT = 15
+
+# Parallel LLM calls for per-column analyses
+DEFAULT_CONCURRENCY = 1
@@ -10,21 +10,77 @@ from nodes import (
     GenerateReportNode
 )
 
-def create_data_profiling_flow():
-    """Create and return a data profiling flow."""
+# Node for each analysis, in the order they run in the flow
+ANALYSIS_NODES = {
+    "duplicates": DuplicateDetectionNode,
+    "table_summary": TableSummaryNode,
+    "column_descriptions": ColumnDescriptionNode,
+    "data_types": DataTypeAnalysisNode,
+    "missing_values": MissingValuesAnalysisNode,
+    "uniqueness": UniquenessAnalysisNode,
+    "unusual_values": UnusualValuesDetectionNode
+}
+
+# Analyses whose LLM prompt uses the results of other analyses
+ANALYSIS_DEPENDENCIES = {
+    "uniqueness": ["table_summary"]
+}
+
+# Analyses that still produce statistics when the LLM is skipped
+STATS_ANALYSES = ["duplicates", "missing_values", "uniqueness"]
+
+# LLM answers that fail validation, or are aborted early while streaming,
+# are retried this many times in total, waiting LLM_RETRY_WAIT seconds between
+LLM_MAX_RETRIES = 3
+LLM_RETRY_WAIT = 1
+
+def resolve_analyses(analyses=None, stats_only=False):
+    """Return the requested analyses plus their dependencies, in flow order."""
+    if analyses is None:
+        analyses = STATS_ANALYSES if stats_only else list(ANALYSIS_NODES)
+    
+    unknown = [name for name in analyses if name not in ANALYSIS_NODES]
+    if unknown:
+        raise ValueError(f"Unknown analyses: {', '.join(unknown)}")
+    
+    if stats_only:
+        needs_llm = [name for name in analyses if name not in STATS_ANALYSES]
+        if needs_llm:
+            raise ValueError(f"Analyses require the LLM: {', '.join(needs_llm)}")
+        # Without the LLM no prompt is built, so dependencies aren't needed
+        selected = set(analyses)
+    else:
+        selected = set()
+        pending = list(analyses)
+        while pending:
+            name = pending.pop()
+            if name not in selected:
+                selected.add(name)
+                pending.extend(ANALYSIS_DEPENDENCIES.get(name, []))
+    
+    return [name for name in ANALYSIS_NODES if name in selected]
+
+def create_data_profiling_flow(analyses=None, stats_only=False, params=None):
+    """Create and return a data profiling flow.
+    
+    Only the requested `analyses` (default: all) and the analyses they depend
+    on are built, followed by the report. With `stats_only`, only statistical
+    analyses are allowed and they skip their LLM calls. `params` (sample
+    sizes, concurrency) are passed to every node.
+    """
     
-    # Create all nodes
-    duplicate_node = DuplicateDetectionNode()
-    summary_node = TableSummaryNode()
-    column_desc_node = ColumnDescriptionNode()
-    data_type_node = DataTypeAnalysisNode()
-    missing_values_node = MissingValuesAnalysisNode()
-    uniqueness_node = UniquenessAnalysisNode()
-    unusual_values_node = UnusualValuesDetectionNode()
-    report_node = GenerateReportNode()
+    # Create the selected analysis nodes, then the report
+    nodes = [
+        ANALYSIS_NODES[name](max_retries=LLM_MAX_RETRIES, wait=LLM_RETRY_WAIT)
+        for name in resolve_analyses(analyses, stats_only)
+    ]
+    nodes.append(GenerateReportNode())
     
     # Connect nodes in sequence (following the workflow design)
-    duplicate_node >> summary_node >> column_desc_node >> data_type_node >> missing_values_node >> uniqueness_node >> unusual_values_node >> report_node
+    for node, next_node in zip(nodes, nodes[1:]):
+        node >> next_node
     
-    # Create flow starting with duplicate detection
-    return Flow(start=duplicate_node)
\ No newline at end of file
+    # Create flow starting with the first selected analysis
+    flow = Flow(start=nodes[0])
+    flow.set_params({**(params or {}), "stats_only": stats_only})
+    return flow
\ No newline at end of file
@@ -1,48 +1,105 @@
-import pandas as pd
-from flow import create_data_profiling_flow
+import argparse
+import os
+from defaults import DEFAULT_SAMPLE_ROWS, DEFAULT_SUMMARY_ROWS, DEFAULT_MAX_DISTINCT, DEFAULT_CONCURRENCY
 
-def main():
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+def parse_args(argv=None):
+    """Parse command-line options for a profiling run"""
+    parser = argparse.ArgumentParser(description="Profile a CSV file with LLM-assisted analysis.")
+    parser.add_argument("input", nargs="?", default="test/patients.csv",
+                        help="CSV file to profile (default: test/patients.csv)")
+    parser.add_argument("-o", "--output", default="data_profiling_report.md",
+                        help="Where to write the markdown report (default: data_profiling_report.md)")
+    parser.add_argument("--json", metavar="PATH",
+                        help="Also write the full profile as compact JSON")
+    parser.add_argument("--parquet", metavar="PATH",
+                        help="Also write a per-column profile table as Parquet (requires pyarrow)")
+    parser.add_argument("--analyses", nargs="+", metavar="NAME",
+                        help="Only run these analyses (and what they depend on): duplicates, table_summary, "
+                             "column_descriptions, data_types, missing_values, uniqueness, unusual_values")
+    parser.add_argument("--stats-only", action="store_true",
+                        help="Only compute duplicate, missing value and uniqueness stats; never call the LLM")
+    parser.add_argument("--sample-rows", type=positive_int, default=DEFAULT_SAMPLE_ROWS,
+                        help="Rows of sample data shown to the LLM per analysis (default: %(default)s)")
+    parser.add_argument("--summary-rows", type=positive_int, default=DEFAULT_SUMMARY_ROWS,
+                        help="Rows of sample data used for the table summary (default: %(default)s)")
+    parser.add_argument("--max-distinct", type=positive_int, default=DEFAULT_MAX_DISTINCT,
+                        help="Distinct values per column shown to the LLM for unusual value detection (default: %(default)s)")
+    parser.add_argument("--concurrency", type=positive_int, default=DEFAULT_CONCURRENCY,
+                        help="Parallel LLM calls for per-column analyses (default: %(default)s)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main function for data profiling"""
-    
-    # Load the test dataset
-    print("Loading patient data...")
-    df = pd.read_csv("test/patients.csv")
+    args = parse_args(argv)
+
+    # Deferred so that --help and argument errors return immediately
+    import pandas as pd
+    from flow import create_data_profiling_flow
+
+    # Build the flow before loading data so a bad selection fails fast
+    try:
+        profiling_flow = create_data_profiling_flow(
+            analyses=args.analyses,
+            stats_only=args.stats_only,
+            params={
+                "sample_rows": args.sample_rows,
+                "summary_rows": args.summary_rows,
+                "max_distinct": args.max_distinct,
+                "concurrency": args.concurrency
+            }
+        )
+    except ValueError as e:
+        raise SystemExit(f"error: {e}")
+
+    # Load the dataset
+    print(f"Loading {args.input}...")
+    df = pd.read_csv(args.input)
     print(f"Loaded {len(df)} rows and {len(df.columns)} columns")
-    
-    # Initialize shared store with the data profiling structure
+
+    # Initialize shared store; each node fills in its own profile_results entry
     shared = {
         "dataframe": df,
         "sample_data": "",
-        "profile_results": {
-            "duplicates": {},
-            "table_summary": "",
-            "column_descriptions": {},
-            "data_types": {},
-            "missing_values": {},
-            "uniqueness": {},
-            "unusual_values": {}
-        },
+        "profile_results": {},
         "final_report": ""
     }
-    
-    # Create and run the data profiling flow
+
+    # Run the data profiling flow
     print("\nStarting data profiling analysis...")
-    profiling_flow = create_data_profiling_flow()
     profiling_flow.run(shared)
-    
+
     # Save the report first (avoid console encoding issues)
-    with open("data_profiling_report.md", "w", encoding="utf-8") as f:
+    with open(args.output, "w", encoding="utf-8") as f:
         f.write(shared["final_report"])
-    print("\nReport saved to: data_profiling_report.md")
+    print(f"\nReport saved to: {args.output}")
     print(f"Report contains {len(shared['final_report'])} characters")
-    
+
+    # Machine-readable profile output for downstream systems
+    if args.json or args.parquet:
+        from utils.profile_export import write_profile_json, write_profile_parquet
+        if args.json:
+            write_profile_json(shared["profile_results"], args.json)
+            print(f"Profile JSON saved to: {args.json}")
+        if args.parquet:
+            table_name = os.path.splitext(os.path.basename(args.input))[0]
+            write_profile_parquet(shared["profile_results"], args.parquet, table_name=table_name)
+            print(f"Profile Parquet saved to: {args.parquet}")
+
     # Show basic stats instead of full report
     print("\n" + "="*50 + " SUMMARY " + "="*50)
-    dup = shared["profile_results"]["duplicates"]
-    print(f"✓ Analyzed {dup['total_rows']} rows, {len(shared['dataframe'].columns)} columns")
-    print(f"✓ Found {dup['count']} duplicate rows ({dup['percentage']:.1f}%)")
-    print(f"✓ Analysis complete - check data_profiling_report.md for full details")
+    print(f"✓ Analyzed {len(df)} rows, {len(df.columns)} columns")
+    if "duplicates" in shared["profile_results"]:
+        dup = shared["profile_results"]["duplicates"]
+        print(f"✓ Found {dup['count']} duplicate rows ({dup['percentage']:.1f}%)")
+    print(f"✓ Analysis complete - check {args.output} for full details")
     print("="*108)
 
 if __name__ == "__main__":
-    main()
+    main()
\ No newline at end of file
@@ -1,7 +1,15 @@
+import time
 import pandas as pd
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pocketflow import Node, BatchNode
-from utils.call_llm import call_llm
+from utils.call_llm import call_llm, call_llm_stream
+from defaults import DEFAULT_SAMPLE_ROWS, DEFAULT_SUMMARY_ROWS, DEFAULT_MAX_DISTINCT, DEFAULT_CONCURRENCY
+
+# Abort streamed LLM responses that grow past a base allowance plus a
+# per-entry allowance for each entry (e.g. column) the answer should contain
+RESPONSE_BASE_CHARS = 4000
+RESPONSE_CHARS_PER_ENTRY = 2000
 
 def truncate_cell(value, max_length=50):
     """Truncate cell values for display purposes"""
@@ -13,6 +21,117 @@ def truncate_cell(value, max_length=50):
     return str_value
 
 
+def _top_level_key(line):
+    """Return the key of a top-level YAML mapping line, or None"""
+    if not line.strip() or line[0] in " \t#-" or line.startswith("..."):
+        return None
+    try:
+        parsed = yaml.safe_load(line)
+    except yaml.YAMLError:
+        return None
+    if isinstance(parsed, dict) and len(parsed) == 1:
+        return str(next(iter(parsed)))
+    return None
+
+
+def _is_complete_yaml(text):
+    """Whether text parses on its own, i.e. no quoted scalar is left open"""
+    try:
+        yaml.safe_load(text)
+    except yaml.YAMLError:
+        return False
+    return True
+
+
+def response_char_cap(entry_count):
+    """Longest plausible response for an answer with `entry_count` entries"""
+    return RESPONSE_BASE_CHARS + RESPONSE_CHARS_PER_ENTRY * entry_count
+
+
+def parse_yaml_stream(chunks, expected_keys=None, max_chars=None):
+    """Parse the ```yaml block of a streamed LLM response as it arrives.
+
+    Stops reading once the closing fence arrives, and aborts early (closing the
+    stream) if a top-level key outside `expected_keys` shows up or the response
+    grows past `max_chars` (default: scaled with the number of expected keys).
+    """
+    expected = {str(key) for key in expected_keys} if expected_keys is not None else None
+    if max_chars is None:
+        max_chars = response_char_cap(len(expected) if expected is not None else 1)
+    buffer = ""
+    start = None  # offset of the yaml body in buffer
+    checked = 0   # length of the yaml body already validated
+    yaml_str = None
+    try:
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) > max_chars:
+                raise ValueError(f"LLM response exceeded {max_chars} characters")
+            
+            if start is None:
+                fence = buffer.find("```yaml")
+                if fence == -1:
+                    continue
+                start = fence + len("```yaml")
+            
+            body = buffer[start:]
+            end = body.find("```")
+            if end != -1:
+                body = body[:end] + "\n"
+            
+            # Validate every complete line we haven't seen yet. A line that looks
+            # like an unexpected key may continue a quoted value opened earlier,
+            # so it only counts as a key if the YAML before it parses on its own.
+            for line in body[checked:].split("\n")[:-1]:
+                key = _top_level_key(line)
+                if (expected is not None and key is not None and key not in expected
+                        and _is_complete_yaml(body[:checked])):
+                    raise ValueError(f"Unexpected key in LLM response: {key}")
+                checked += len(line) + 1
+            
+            if end != -1:
+                yaml_str = body
+                break
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+    
+    if start is None:
+        raise ValueError("No ```yaml block found in LLM response")
+    if yaml_str is None:
+        yaml_str = buffer[start:]
+    return yaml.safe_load(yaml_str.strip())
+
+
+def add_report_section(shared, key):
+    """Render the report section for `key` from the results just written"""
+    render = dict(REPORT_SECTIONS)[key]
+    shared.setdefault("report_sections", {})[key] = render(shared["profile_results"])
+
+
+class ThreadedBatchNode(BatchNode):
+    """BatchNode that runs items on a thread pool sized by the `concurrency` param"""
+    def _exec_item(self, item):
+        # Same retry loop as Node._exec, but the attempt counter is local:
+        # self.cur_retry would be shared by all worker threads
+        for retry in range(self.max_retries):
+            try:
+                return self.exec(item)
+            except Exception as e:
+                if retry == self.max_retries - 1:
+                    return self.exec_fallback(item, e)
+                if self.wait > 0:
+                    time.sleep(self.wait)
+
+    def _exec(self, items):
+        workers = self.params.get("concurrency", DEFAULT_CONCURRENCY)
+        if workers <= 1:
+            return [self._exec_item(item) for item in items or []]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._exec_item, items or []))
+
+
 class DuplicateDetectionNode(Node):
     def prep(self, shared):
         df = shared["dataframe"]
@@ -25,7 +144,7 @@ class DuplicateDetectionNode(Node):
         # Get sample of duplicate rows for LLM analysis
         sample_duplicates = ""
         if duplicate_count > 0:
-            sample_df = duplicate_rows.head(10).applymap(truncate_cell)
+            sample_df = duplicate_rows.head(self.params.get("sample_rows", DEFAULT_SAMPLE_ROWS)).applymap(truncate_cell)
             sample_duplicates = sample_df.to_csv(index=False, quoting=1)
         
         # Get basic table info for context
@@ -46,6 +165,12 @@ class DuplicateDetectionNode(Node):
                 "analysis": "No duplicate rows found in the dataset."
             }
         
+        if self.params.get("stats_only"):
+            return {
+                "should_remove": None,
+                "analysis": "Duplicates were not analyzed (stats only)."
+            }
+        
         prompt = f"""
 You have a table with {prep_res["total_rows"]} total rows and {prep_res["duplicate_count"]} duplicate rows ({prep_res["duplicate_percentage"]:.2f}%).
 
@@ -64,9 +189,7 @@ analysis: "Brief analysis explaining why duplicates should/shouldn't be removed"
 ```
 """
         
-        response = call_llm(prompt)
-        yaml_str = response.split("```yaml")[1].split("```")[0].strip()
-        result = yaml.safe_load(yaml_str)
+        result = parse_yaml_stream(call_llm_stream(prompt), expected_keys=["should_remove", "analysis"])
         
         assert "should_remove" in result
         assert "analysis" in result
@@ -84,13 +207,14 @@ analysis: "Brief analysis explaining why duplicates should/shouldn't be removed"
             "analysis": exec_res["analysis"],
             "sample_rows": prep_res["sample_duplicates"]
         }
+        add_report_section(shared, "duplicates")
 
 class TableSummaryNode(Node):
     def prep(self, shared):
         df = shared["dataframe"]
         
         # Create a sample for LLM analysis
-        sample_df = df.head(50).applymap(truncate_cell)
+        sample_df = df.head(self.params.get("summary_rows", DEFAULT_SUMMARY_ROWS)).applymap(truncate_cell)
         sample_data = sample_df.to_csv(index=False, quoting=1)
         
         # Basic info
@@ -127,9 +251,10 @@ Your summary:
 
     def post(self, shared, prep_res, exec_res):
         shared["profile_results"]["table_summary"] = exec_res
+        add_report_section(shared, "table_summary")
         return "default"
 
-class ColumnDescriptionNode(BatchNode):
+class ColumnDescriptionNode(ThreadedBatchNode):
     def prep(self, shared):
         df = shared["dataframe"]
         columns = list(df.columns)
@@ -162,9 +287,7 @@ Return in YAML format:
 ```
 """
         
-        response = call_llm(prompt)
-        yaml_str = response.split("```yaml")[1].split("```")[0].strip()
-        result = yaml.safe_load(yaml_str)
+        result = parse_yaml_stream(call_llm_stream(prompt), expected_keys=chunk_columns)
         
         # Validate all columns are present with required fields
         for col in chunk_columns:
@@ -184,6 +307,7 @@ Return in YAML format:
         
         # Convert to the expected format (now already in the right structure from YAML)
         shared["profile_results"]["column_descriptions"] = all_descriptions
+        add_report_section(shared, "column_descriptions")
         return "default"
 
 class DataTypeAnalysisNode(Node):
@@ -194,7 +318,7 @@ class DataTypeAnalysisNode(Node):
         current_types = {col: str(df[col].dtype) for col in df.columns}
         
         # Get sample data
-        sample_df = df.head(10).applymap(truncate_cell)
+        sample_df = df.head(self.params.get("sample_rows", DEFAULT_SAMPLE_ROWS)).applymap(truncate_cell)
         sample_data = sample_df.to_csv(index=False, quoting=1)
         
         return {
@@ -225,9 +349,7 @@ column1:
 ```
 """
         
-        response = call_llm(prompt)
-        yaml_str = response.split("```yaml")[1].split("```")[0].strip()
-        result = yaml.safe_load(yaml_str)
+        result = parse_yaml_stream(call_llm_stream(prompt), expected_keys=prep_res["columns"])
         
         # Validate all columns are present with required fields
         for col in prep_res["columns"]:
@@ -250,6 +372,7 @@ column1:
             }
         
         shared["profile_results"]["data_types"] = data_types
+        add_report_section(shared, "data_types")
         return "default"
 
 class MissingValuesAnalysisNode(Node):
@@ -268,7 +391,7 @@ class MissingValuesAnalysisNode(Node):
                 }
         
         # Get sample data
-        sample_df = df.head(10).applymap(truncate_cell)
+        sample_df = df.head(self.params.get("sample_rows", DEFAULT_SAMPLE_ROWS)).applymap(truncate_cell)
         sample_data = sample_df.to_csv(index=False, quoting=1)
         
         return {
@@ -280,8 +403,14 @@ class MissingValuesAnalysisNode(Node):
     def exec(self, prep_res):
         if not prep_res["missing_info"]:
             return {
-                "reasoning": "No missing values found in any columns.",
-                "columns_analysis": {}
+                "overall_analysis": "No missing values found in any columns.",
+                "columns": {}
+            }
+        
+        if self.params.get("stats_only"):
+            return {
+                "overall_analysis": "Missing values were not analyzed (stats only).",
+                "columns": {}
             }
         
         missing_desc = "\n".join([
@@ -309,9 +438,11 @@ columns:
 ```
 """
         
-        response = call_llm(prompt)
-        yaml_str = response.split("```yaml")[1].split("```")[0].strip()
-        result = yaml.safe_load(yaml_str)
+        result = parse_yaml_stream(
+            call_llm_stream(prompt),
+            expected_keys=["overall_analysis", "columns"],
+            max_chars=response_char_cap(len(prep_res["missing_info"]) + 1)
+        )
         
         # Validate structure
         assert "overall_analysis" in result
@@ -334,7 +465,7 @@ columns:
         
         # Process columns with missing values
         for col, info in prep_res["missing_info"].items():
-            analysis = exec_res["columns"][col]
+            analysis = exec_res["columns"].get(col, {"is_meaningful": None, "reason": ""})
             missing_values[col] = {
                 "count": info["count"],
                 "percentage": info["percentage"],
@@ -355,6 +486,7 @@ columns:
         
         shared["profile_results"]["missing_values"] = missing_values
         shared["profile_results"]["missing_analysis"] = exec_res["overall_analysis"]
+        add_report_section(shared, "missing_values")
         return "default"
 
 class UniquenessAnalysisNode(Node):
@@ -375,7 +507,7 @@ class UniquenessAnalysisNode(Node):
             }
         
         # Get sample data and table summary for context
-        sample_df = df.head(10).applymap(truncate_cell)
+        sample_df = df.head(self.params.get("sample_rows", DEFAULT_SAMPLE_ROWS)).applymap(truncate_cell)
         sample_data = sample_df.to_csv(index=False, quoting=1)
         table_summary = shared["profile_results"].get("table_summary", "")
         
@@ -397,6 +529,12 @@ class UniquenessAnalysisNode(Node):
                 "candidate_keys": {}
             }
         
+        if self.params.get("stats_only"):
+            return {
+                "reasoning": "Candidate keys were not analyzed (stats only).",
+                "candidate_keys": None
+            }
+        
         highly_unique_desc = "\n".join([
             f"{col}: {info['unique_count']}/{info['total_count']} unique ({info['unique_percentage']:.1f}%)"
             for col, info in prep_res["highly_unique"].items()
@@ -428,27 +566,52 @@ candidate_keys:
 ```
 """
         
-        response = call_llm(prompt)
-        yaml_str = response.split("```yaml")[1].split("```")[0].strip()
-        return yaml.safe_load(yaml_str)
+        result = parse_yaml_stream(
+            call_llm_stream(prompt),
+            expected_keys=["reasoning", "candidate_keys"],
+            max_chars=response_char_cap(len(prep_res["highly_unique"]) + 1)
+        )
+        
+        # Validate structure
+        assert "reasoning" in result
+        assert "candidate_keys" in result
+        assert isinstance(result["reasoning"], str)
+        assert isinstance(result["candidate_keys"], dict)
+        
+        # Validate each candidate key analysis
+        for col, analysis in result["candidate_keys"].items():
+            assert "is_candidate_key" in analysis, f"is_candidate_key missing for {col}"
+            assert "explanation" in analysis, f"Explanation missing for {col}"
+            assert isinstance(analysis["is_candidate_key"], bool)
+            assert isinstance(analysis["explanation"], str)
+        
+        return result
 
     def post(self, shared, prep_res, exec_res):
         uniqueness = {}
+        candidate_keys = exec_res.get("candidate_keys", {})
         
         for col, info in prep_res["uniqueness_info"].items():
-            candidate_analysis = exec_res.get("candidate_keys", {}).get(col, {})
+            if candidate_keys is None:
+                # Key analysis was skipped (stats only), so it's unknown, not False
+                is_candidate_key, explanation = None, None
+            else:
+                candidate_analysis = candidate_keys.get(col, {})
+                is_candidate_key = candidate_analysis.get("is_candidate_key", False)
+                explanation = candidate_analysis.get("explanation", "")
             uniqueness[col] = {
                 "unique_count": info["unique_count"],
                 "unique_percentage": info["unique_percentage"],
-                "is_candidate_key": candidate_analysis.get("is_candidate_key", False),
-                "explanation": candidate_analysis.get("explanation", "")
+                "is_candidate_key": is_candidate_key,
+                "explanation": explanation
             }
         
         shared["profile_results"]["uniqueness"] = uniqueness
         shared["profile_results"]["uniqueness_reasoning"] = exec_res.get("reasoning", "")
+        add_report_section(shared, "uniqueness")
         return "default"
 
-class UnusualValuesDetectionNode(BatchNode):
+class UnusualValuesDetectionNode(ThreadedBatchNode):
     def prep(self, shared):
         df = shared["dataframe"]
         columns = list(df.columns)
@@ -456,8 +619,9 @@ class UnusualValuesDetectionNode(BatchNode):
         # Create analysis tasks for each column
         column_tasks = []
         for col in columns:
-            # Get sample of distinct values (up to 1000 for inspection)
-            sample_values = df[col].dropna().drop_duplicates().head(1000)
+            # Get sample of distinct values (up to max_distinct are shown to the LLM)
+            max_distinct = self.params.get("max_distinct", DEFAULT_MAX_DISTINCT)
+            sample_values = df[col].dropna().drop_duplicates().head(max_distinct)
             sample_list = [truncate_cell(val, 100) for val in sample_values]
             
             column_tasks.append({
@@ -480,7 +644,7 @@ class UnusualValuesDetectionNode(BatchNode):
                 "explanation": "No values to analyze (all missing)"
             }
         
-        values_str = ", ".join([f"'{val}'" for val in sample_values[:15]])
+        values_str = ", ".join([f"'{val}'" for val in sample_values])
         
         prompt = f"""
 Column "{col_name}" (type: {data_type}) has the following sample values:
@@ -495,9 +659,7 @@ explanation: "Brief explanation of findings"
 ```
 """
         
-        response = call_llm(prompt)
-        yaml_str = response.split("```yaml")[1].split("```")[0].strip()
-        result = yaml.safe_load(yaml_str)
+        result = parse_yaml_stream(call_llm_stream(prompt), expected_keys=["has_unusual", "explanation"])
         
         # Validate structure
         assert "has_unusual" in result
@@ -519,126 +681,160 @@ explanation: "Brief explanation of findings"
             }
         
         shared["profile_results"]["unusual_values"] = unusual_values
+        add_report_section(shared, "unusual_values")
         return "default"
 
+def render_table_summary(profile_results):
+    return [
+        "## Table Summary",
+        profile_results["table_summary"],
+        ""
+    ]
+
+def render_duplicates(profile_results):
+    dup = profile_results["duplicates"]
+    lines = [
+        "## Duplicate Analysis",
+        f"- **Total rows**: {dup['total_rows']}",
+        f"- **Duplicate rows**: {dup['count']} ({dup['percentage']:.2f}%)"
+    ]
+    if dup['should_remove'] is not None:
+        lines.append(f"- **Should remove**: {dup['should_remove']}")
+    lines.append(f"- **Analysis**: {dup['analysis']}")
+    lines.append("")
+    return lines
+
+def render_column_descriptions(profile_results):
+    lines = ["## Column Descriptions"]
+    for col, info in profile_results["column_descriptions"].items():
+        suggested = f" → *{info['suggested_name']}*" if info['suggested_name'] != col else ""
+        lines.append(f"- **{col}**{suggested}: {info['description']}")
+    lines.append("")
+    return lines
+
+def render_data_types(profile_results):
+    lines = ["## Data Type Analysis"]
+    changes_found = False
+    for col, info in profile_results["data_types"].items():
+        if info['suggested_type'] != info['current_type']:
+            lines.append(f"- **{col}**: {info['current_type']} → *{info['suggested_type']}* ({info['reason']})")
+            changes_found = True
+    if not changes_found:
+        lines.append("- All data types are appropriate")
+    lines.append("")
+    return lines
+
+def render_missing_values(profile_results):
+    lines = ["## Missing Values Analysis"]
+    if "missing_analysis" in profile_results:
+        lines.append(f"**Overview**: {profile_results['missing_analysis']}")
+        lines.append("")
+    
+    problematic_missing = []
+    meaningful_missing = []
+    unanalyzed_missing = []
+    
+    for col, info in profile_results["missing_values"].items():
+        if info['count'] > 0:
+            entry = f"**{col}**: {info['count']} missing ({info['percentage']:.1f}%)"
+            if info['is_meaningful'] is None:
+                unanalyzed_missing.append(entry)
+                continue
+            entry += f" - {info['reason']}"
+            if info['is_meaningful']:
+                meaningful_missing.append(entry)
+            else:
+                problematic_missing.append(entry)
+    
+    if problematic_missing:
+        lines.append("### Problematic Missing Values")
+        for entry in problematic_missing:
+            lines.append(f"- {entry}")
+        lines.append("")
+    
+    if meaningful_missing:
+        lines.append("### Likely Meaningful Missing Values")
+        for entry in meaningful_missing:
+            lines.append(f"- {entry}")
+        lines.append("")
+    
+    if unanalyzed_missing:
+        lines.append("### Missing Values")
+        for entry in unanalyzed_missing:
+            lines.append(f"- {entry}")
+        lines.append("")
+    return lines
+
+def render_uniqueness(profile_results):
+    lines = ["## Uniqueness Analysis"]
+    candidate_keys = []
+    highly_unique = []
+    
+    for col, info in profile_results["uniqueness"].items():
+        if info['is_candidate_key']:
+            candidate_keys.append(f"**{col}**: {info['explanation']}")
+        elif info['unique_percentage'] > 50:
+            highly_unique.append(f"**{col}**: {info['unique_percentage']:.1f}% unique")
+    
+    if candidate_keys:
+        lines.append("### Candidate Key Columns")
+        for key in candidate_keys:
+            lines.append(f"- {key}")
+        lines.append("")
+        
+    if highly_unique:
+        lines.append("### Highly Unique Columns")
+        for col in highly_unique:
+            lines.append(f"- {col}")
+        lines.append("")
+    return lines
+
+def render_unusual_values(profile_results):
+    lines = ["## Unusual Values Detection"]
+    unusual_found = []
+    
+    for col, info in profile_results["unusual_values"].items():
+        if info['has_unusual']:
+            unusual_found.append(f"**{col}**: {info['explanation']}")
+    
+    if unusual_found:
+        for finding in unusual_found:
+            lines.append(f"- {finding}")
+    else:
+        lines.append("- No unusual values detected")
+    lines.append("")
+    return lines
+
+# Report sections in output order. Each analysis node renders its section in
+# post() via add_report_section, so the report is assembled as results arrive
+# and GenerateReportNode only has to join the sections.
+REPORT_SECTIONS = [
+    ("table_summary", render_table_summary),
+    ("duplicates", render_duplicates),
+    ("column_descriptions", render_column_descriptions),
+    ("data_types", render_data_types),
+    ("missing_values", render_missing_values),
+    ("uniqueness", render_uniqueness),
+    ("unusual_values", render_unusual_values)
+]
+
 class GenerateReportNode(Node):
     def prep(self, shared):
-        return shared["profile_results"]
+        return shared.get("report_sections", {})
 
-    def exec(self, profile_results):
+    def exec(self, report_sections):
         # Generate a comprehensive report
-        report_sections = []
+        report_lines = []
         
         # Title
-        report_sections.append("# Data Profiling Report\n")
-        
-        # Table Summary
-        if "table_summary" in profile_results:
-            report_sections.append("## Table Summary")
-            report_sections.append(profile_results["table_summary"])
-            report_sections.append("")
-        
-        # Duplicates
-        if "duplicates" in profile_results:
-            dup = profile_results["duplicates"]
-            report_sections.append("## Duplicate Analysis")
-            report_sections.append(f"- **Total rows**: {dup['total_rows']}")
-            report_sections.append(f"- **Duplicate rows**: {dup['count']} ({dup['percentage']:.2f}%)")
-            report_sections.append(f"- **Should remove**: {dup['should_remove']}")
-            report_sections.append(f"- **Analysis**: {dup['analysis']}")
-            report_sections.append("")
-        
-        # Column Descriptions
-        if "column_descriptions" in profile_results:
-            report_sections.append("## Column Descriptions")
-            for col, info in profile_results["column_descriptions"].items():
-                suggested = f" → *{info['suggested_name']}*" if info['suggested_name'] != col else ""
-                report_sections.append(f"- **{col}**{suggested}: {info['description']}")
-            report_sections.append("")
-        
-        # Data Types
-        if "data_types" in profile_results:
-            report_sections.append("## Data Type Analysis")
-            changes_found = False
-            for col, info in profile_results["data_types"].items():
-                if info['suggested_type'] != info['current_type']:
-                    report_sections.append(f"- **{col}**: {info['current_type']} → *{info['suggested_type']}* ({info['reason']})")
-                    changes_found = True
-            if not changes_found:
-                report_sections.append("- All data types are appropriate")
-            report_sections.append("")
-        
-        # Missing Values
-        if "missing_values" in profile_results:
-            report_sections.append("## Missing Values Analysis")
-            if "missing_analysis" in profile_results:
-                report_sections.append(f"**Overview**: {profile_results['missing_analysis']}")
-                report_sections.append("")
-            
-            problematic_missing = []
-            meaningful_missing = []
-            
-            for col, info in profile_results["missing_values"].items():
-                if info['count'] > 0:
-                    entry = f"**{col}**: {info['count']} missing ({info['percentage']:.1f}%) - {info['reason']}"
-                    if info['is_meaningful']:
-                        meaningful_missing.append(entry)
-                    else:
-                        problematic_missing.append(entry)
-            
-            if problematic_missing:
-                report_sections.append("### Problematic Missing Values")
-                for entry in problematic_missing:
-                    report_sections.append(f"- {entry}")
-                report_sections.append("")
-            
-            if meaningful_missing:
-                report_sections.append("### Likely Meaningful Missing Values") 
-                for entry in meaningful_missing:
-                    report_sections.append(f"- {entry}")
-                report_sections.append("")
-        
-        # Uniqueness
-        if "uniqueness" in profile_results:
-            report_sections.append("## Uniqueness Analysis")
-            candidate_keys = []
-            highly_unique = []
-            
-            for col, info in profile_results["uniqueness"].items():
-                if info['is_candidate_key']:
-                    candidate_keys.append(f"**{col}**: {info['explanation']}")
-                elif info['unique_percentage'] > 50:
-                    highly_unique.append(f"**{col}**: {info['unique_percentage']:.1f}% unique")
-            
-            if candidate_keys:
-                report_sections.append("### Candidate Key Columns")
-                for key in candidate_keys:
-                    report_sections.append(f"- {key}")
-                report_sections.append("")
-                
-            if highly_unique:
-                report_sections.append("### Highly Unique Columns")
-                for col in highly_unique:
-                    report_sections.append(f"- {col}")
-                report_sections.append("")
-        
-        # Unusual Values
-        if "unusual_values" in profile_results:
-            report_sections.append("## Unusual Values Detection")
-            unusual_found = []
-            
-            for col, info in profile_results["unusual_values"].items():
-                if info['has_unusual']:
-                    unusual_found.append(f"**{col}**: {info['explanation']}")
-            
-            if unusual_found:
-                for finding in unusual_found:
-                    report_sections.append(f"- {finding}")
-            else:
-                report_sections.append("- No unusual values detected")
-            report_sections.append("")
+        report_lines.append("# Data Profiling Report\n")
+        
+        # Join the sections rendered by the analyses, skipping those that didn't run
+        for key, _ in REPORT_SECTIONS:
+            if key in report_sections:
+                report_lines.extend(report_sections[key])
         
-        return "\n".join(report_sections)
+        return "\n".join(report_lines)
 
     def post(self, shared, prep_res, exec_res):
         shared["final_report"] = exec_res
@@ -0,0 +1,86 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.call_llm import LLMBackend, RecordingBackend, ReplayBackend
+
+
+class FakeBackend(LLMBackend):
+    def __init__(self, responses):
+        self.responses = responses
+
+    def generate(self, prompt):
+        return self.responses[prompt]
+
+    def stream(self, prompt):
+        response = self.responses[prompt]
+        for i in range(0, len(response), 4):
+            yield response[i:i + 4]
+
+
+class FailingBackend(LLMBackend):
+    def generate(self, prompt):
+        raise RuntimeError("429 RESOURCE_EXHAUSTED")
+
+    def stream(self, prompt):
+        yield "```yaml\n"
+        raise RuntimeError("429 RESOURCE_EXHAUSTED")
+
+
+def test_failed_calls_are_not_recorded(tmp_path):
+    path = tmp_path / "recordings.jsonl"
+    recorder = RecordingBackend(FailingBackend(), str(path))
+
+    with pytest.raises(RuntimeError, match="RESOURCE_EXHAUSTED"):
+        recorder.generate("prompt")
+    with pytest.raises(RuntimeError, match="RESOURCE_EXHAUSTED"):
+        list(recorder.stream("prompt"))
+
+    assert not path.exists() or path.read_text() == ""
+
+
+def record(tmp_path, responses):
+    path = tmp_path / "recordings.jsonl"
+    return RecordingBackend(FakeBackend(responses), str(path)), str(path)
+
+
+def test_record_then_replay_round_trip(tmp_path):
+    recorder, path = record(tmp_path, {"one": "first answer", "two": "second, streamed answer"})
+    assert recorder.generate("one") == "first answer"
+    assert "".join(recorder.stream("two")) == "second, streamed answer"
+
+    replay = ReplayBackend(path, latency_scale=0, chunk_size=5)
+    assert replay.generate("one") == "first answer"
+    assert "".join(replay.stream("two")) == "second, streamed answer"
+    assert list(replay.stream("two"))[0] == "secon"
+
+
+def test_stream_closed_early_is_recorded_as_received(tmp_path):
+    recorder, path = record(tmp_path, {"prompt": "```yaml\na: 1\n```\nmore text"})
+    stream = recorder.stream("prompt")
+    received = next(stream) + next(stream)
+    stream.close()
+
+    assert ReplayBackend(path, latency_scale=0).generate("prompt") == received
+
+
+def test_replay_unknown_prompt_raises_key_error(tmp_path):
+    recorder, path = record(tmp_path, {"known": "answer"})
+    recorder.generate("known")
+    replay = ReplayBackend(path, latency_scale=0)
+
+    with pytest.raises(KeyError, match="No recorded response"):
+        replay.generate("unknown")
+    with pytest.raises(KeyError, match="No recorded response"):
+        list(replay.stream("unknown"))
+
+
+def test_backend_without_generate_fails_on_creation():
+    class Incomplete(LLMBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
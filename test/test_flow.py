@@ -0,0 +1,99 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flow
+from utils import call_llm
+from utils.call_llm import LLMBackend
+
+
+class ScriptedBackend(LLMBackend):
+    """Returns the scripted responses in order, one per call"""
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.chunks_sent = []
+
+    def generate(self, prompt):
+        return "".join(self.stream(prompt))
+
+    def stream(self, prompt):
+        response = self.responses[self.calls]
+        self.calls += 1
+        sent = []
+        self.chunks_sent.append(sent)
+        for line in response.splitlines(keepends=True):
+            sent.append(line)
+            yield line
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """Install a backend for one test, without waiting between retries"""
+    monkeypatch.setattr(flow, "LLM_RETRY_WAIT", 0)
+    return lambda llm_backend: monkeypatch.setattr(call_llm, "_backend", llm_backend)
+
+
+def test_aborted_answer_recovers_on_retry(backend):
+    off_schema = '```yaml\nshould_remove: true\nnote: "copied from elsewhere"\nanalysis: "never read"\n```'
+    valid = '```yaml\nshould_remove: true\nanalysis: "Exact copies of the same export"\n```'
+    scripted = ScriptedBackend([off_schema, valid])
+    backend(scripted)
+
+    shared = {
+        "dataframe": pd.DataFrame({"a": [1, 1, 2], "b": ["x", "x", "y"]}),
+        "profile_results": {}
+    }
+    flow.create_data_profiling_flow(analyses=["duplicates"]).run(shared)
+
+    assert scripted.calls == 2
+    assert 'analysis: "never read"\n' not in scripted.chunks_sent[0]
+    duplicates = shared["profile_results"]["duplicates"]
+    assert duplicates["count"] == 1
+    assert duplicates["should_remove"] is True
+    assert duplicates["analysis"] == "Exact copies of the same export"
+
+
+def test_default_runs_every_analysis_in_flow_order():
+    assert flow.resolve_analyses() == list(flow.ANALYSIS_NODES)
+
+
+def test_default_stats_only_runs_statistical_analyses():
+    assert flow.resolve_analyses(stats_only=True) == flow.STATS_ANALYSES
+
+
+def test_uniqueness_pulls_in_table_summary_for_llm_runs():
+    assert flow.resolve_analyses(["uniqueness"]) == ["table_summary", "uniqueness"]
+
+
+def test_uniqueness_runs_alone_in_stats_only_mode():
+    assert flow.resolve_analyses(["uniqueness"], stats_only=True) == ["uniqueness"]
+
+
+def test_selection_is_returned_in_flow_order_without_duplicates():
+    requested = ["unusual_values", "duplicates", "data_types", "duplicates"]
+    assert flow.resolve_analyses(requested) == ["duplicates", "data_types", "unusual_values"]
+
+
+def test_unknown_analysis_raises():
+    with pytest.raises(ValueError, match="Unknown analyses: bogus"):
+        flow.resolve_analyses(["duplicates", "bogus"])
+
+
+def test_llm_only_analysis_raises_in_stats_only_mode():
+    with pytest.raises(ValueError, match="Analyses require the LLM: table_summary"):
+        flow.resolve_analyses(["duplicates", "table_summary"], stats_only=True)
+
+
+def test_partial_flow_builds_only_selected_nodes():
+    built = flow.create_data_profiling_flow(analyses=["uniqueness"])
+    node_types = []
+    node = built.start_node
+    while node is not None:
+        node_types.append(type(node).__name__)
+        node = node.successors.get("default")
+    assert node_types == ["TableSummaryNode", "UniquenessAnalysisNode", "GenerateReportNode"]
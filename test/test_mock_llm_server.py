@@ -0,0 +1,77 @@
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.call_llm import ReplayBackend, prompt_key
+from utils.mock_llm_server import make_handler
+
+ANSWER = "```yaml\nhas_unusual: false\nexplanation: \"All values look fine\"\n```"
+
+
+@pytest.fixture
+def server_url(tmp_path):
+    path = tmp_path / "recordings.jsonl"
+    entry = {"key": prompt_key("known prompt"), "prompt": "known prompt", "response": ANSWER,
+             "latency": 0.5, "first_chunk_latency": 0.1}
+    path.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+
+    backend = ReplayBackend(str(path), latency_scale=0, chunk_size=10)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(backend))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def post(url, prompt):
+    body = json.dumps({"contents": [{"role": "user", "parts": [{"text": prompt}]}]}).encode("utf-8")
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    return urllib.request.urlopen(request, timeout=5)
+
+
+def test_generate_content(server_url):
+    with post(f"{server_url}/v1beta/models/gemini-2.5-pro:generateContent", "known prompt") as response:
+        payload = json.load(response)
+    candidate = payload["candidates"][0]
+    assert candidate["content"]["parts"][0]["text"] == ANSWER
+    assert candidate["finishReason"] == "STOP"
+
+
+def test_stream_generate_content_uses_sse(server_url):
+    url = f"{server_url}/v1beta/models/gemini-2.5-pro:streamGenerateContent?alt=sse"
+    with post(url, "known prompt") as response:
+        assert response.headers["Content-Type"] == "text/event-stream"
+        events = [
+            json.loads(line[len("data: "):])
+            for line in response.read().decode("utf-8").split("\r\n")
+            if line.startswith("data: ")
+        ]
+
+    texts = [event["candidates"][0]["content"]["parts"][0]["text"] for event in events]
+    assert len(events) > 1
+    assert "".join(texts) == ANSWER
+    assert events[-1]["candidates"][0]["finishReason"] == "STOP"
+    assert all("finishReason" not in event["candidates"][0] for event in events[:-1])
+
+
+@pytest.mark.parametrize("method", ["generateContent", "streamGenerateContent?alt=sse"])
+def test_unknown_prompt_is_404(server_url, method):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(f"{server_url}/v1beta/models/gemini-2.5-pro:{method}", "unknown prompt")
+    assert error.value.code == 404
+    assert json.load(error.value)["error"]["status"] == "NOT_FOUND"
+
+
+def test_unknown_path_is_404(server_url):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(f"{server_url}/v1beta/models/gemini-2.5-pro:countTokens", "known prompt")
+    assert error.value.code == 404
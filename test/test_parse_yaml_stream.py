@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nodes import parse_yaml_stream
+
+RESPONSE = """Here is my analysis.
+```yaml
+should_remove: false
+analysis: "Rows repeat because the export ran twice"
+```
+Let me know if you need more."""
+
+EXPECTED = {"should_remove": False, "analysis": "Rows repeat because the export ran twice"}
+
+
+def chunked(text, size):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 1000])
+def test_fences_split_across_chunks(size):
+    result = parse_yaml_stream(chunked(RESPONSE, size), expected_keys=["should_remove", "analysis"])
+    assert result == EXPECTED
+
+
+def test_prose_before_fence_is_ignored():
+    response = "Sure! should_remove: maybe\nnote: this is prose\n" + RESPONSE
+    result = parse_yaml_stream(chunked(response, 4), expected_keys=["should_remove", "analysis"])
+    assert result == EXPECTED
+
+
+def test_quoted_continuation_line_is_not_a_key():
+    response = '```yaml\nshould_remove: true\nanalysis: "Rows repeat because\nnote: the export ran twice"\n```'
+    result = parse_yaml_stream(chunked(response, 3), expected_keys=["should_remove", "analysis"])
+    assert result == {"should_remove": True, "analysis": "Rows repeat because note: the export ran twice"}
+
+
+def test_unexpected_key_aborts_and_closes_stream():
+    consumed = []
+
+    def chunks():
+        for chunk in ["```yaml\n", "should_remove: true\n", "note: off schema\n", "analysis: late\n", "```"]:
+            consumed.append(chunk)
+            yield chunk
+
+    with pytest.raises(ValueError, match="Unexpected key in LLM response: note"):
+        parse_yaml_stream(chunks(), expected_keys=["should_remove", "analysis"])
+    assert "analysis: late\n" not in consumed
+
+
+def test_stops_reading_at_closing_fence():
+    consumed = []
+
+    def chunks():
+        for chunk in ["```yaml\nshould_remove: false\n", "analysis: ok\n```", "trailing prose"]:
+            consumed.append(chunk)
+            yield chunk
+
+    assert parse_yaml_stream(chunks()) == {"should_remove": False, "analysis": "ok"}
+    assert "trailing prose" not in consumed
+
+
+def test_missing_closing_fence_parses_remaining_body():
+    response = "```yaml\nshould_remove: false\nanalysis: ok\n"
+    assert parse_yaml_stream(chunked(response, 5)) == {"should_remove": False, "analysis": "ok"}
+
+
+def test_missing_fence_raises():
+    with pytest.raises(ValueError, match="No ```yaml block"):
+        parse_yaml_stream(chunked("should_remove: false", 5))
+
+
+def test_overlong_response_aborts():
+    runaway = "```yaml\nanalysis: \"" + "x" * 10000
+
+    with pytest.raises(ValueError, match="exceeded 500 characters"):
+        parse_yaml_stream(chunked(runaway, 100), max_chars=500)
+
+
+def test_cap_scales_with_expected_keys():
+    columns = [f"column_{i}" for i in range(200)]
+    body = "".join(f'{col}:\n  suggested_type: "int64"\n  reason: "{"r" * 80}"\n' for col in columns)
+    result = parse_yaml_stream(chunked("```yaml\n" + body + "```", 64), expected_keys=columns)
+    assert list(result) == columns
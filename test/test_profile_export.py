@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.profile_export import write_profile_json, write_profile_parquet
+
+
+def uniqueness_profile(columns):
+    return {
+        "uniqueness": {
+            col: {
+                "unique_count": np.int64(i),
+                "unique_percentage": np.float64(i * 10.0),
+                "is_candidate_key": np.bool_(i == 0),
+                "explanation": f"column {i}"
+            }
+            for i, col in enumerate(columns)
+        }
+    }
+
+
+def test_json_converts_numpy_values(tmp_path):
+    profile = uniqueness_profile(["id", "name"])
+    profile["duplicates"] = {"count": np.int64(3), "should_remove": np.bool_(True), "percentage": 5.0}
+    path = tmp_path / "profile.json"
+
+    write_profile_json(profile, str(path))
+
+    loaded = json.loads(path.read_text(encoding="utf-8"))
+    assert loaded["duplicates"] == {"count": 3, "should_remove": True, "percentage": 5.0}
+    assert loaded["uniqueness"]["id"]["unique_count"] == 0
+    assert loaded["uniqueness"]["id"]["is_candidate_key"] is True
+    assert loaded["uniqueness"]["name"]["is_candidate_key"] is False
+    # Compact separators, no whitespace between tokens
+    text = path.read_text(encoding="utf-8")
+    assert ", " not in text and ": " not in text
+
+
+def test_json_rejects_unknown_types(tmp_path):
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        write_profile_json({"bad": object()}, str(tmp_path / "profile.json"))
+
+
+def test_parquet_writes_row_groups_and_nulls_for_skipped_analyses(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    columns = [f"col_{i}" for i in range(5)]
+    path = tmp_path / "profile.parquet"
+
+    write_profile_parquet(uniqueness_profile(columns), str(path), table_name="patients", batch_size=2)
+
+    parquet_file = pq.ParquetFile(str(path))
+    assert parquet_file.metadata.num_row_groups == 3
+
+    rows = parquet_file.read().to_pylist()
+    assert [row["column"] for row in rows] == columns
+    assert {row["table"] for row in rows} == {"patients"}
+    assert rows[0]["unique_count"] == 0
+    assert rows[0]["is_candidate_key"] is True
+    assert rows[1]["is_candidate_key"] is False
+    # Analyses that didn't run are null, not defaults
+    assert all(row["description"] is None for row in rows)
+    assert all(row["missing_count"] is None for row in rows)
+    assert all(row["has_unusual"] is None for row in rows)
@@ -0,0 +1,50 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nodes import ThreadedBatchNode
+
+
+class FlakyNode(ThreadedBatchNode):
+    """Fails each item twice before succeeding"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.attempts = {}
+        self.lock = threading.Lock()
+
+    def exec(self, item):
+        with self.lock:
+            self.attempts[item] = self.attempts.get(item, 0) + 1
+            attempt = self.attempts[item]
+        time.sleep(0.005)
+        if attempt < 3:
+            raise ValueError(f"attempt {attempt} for {item}")
+        return item
+
+    def exec_fallback(self, prep_res, exc):
+        return "fallback"
+
+
+def test_each_item_retries_independently_across_threads():
+    node = FlakyNode(max_retries=3)
+    node.set_params({"concurrency": 8})
+
+    assert node._exec(list(range(20))) == list(range(20))
+    assert set(node.attempts.values()) == {3}
+
+
+def test_fallback_after_last_attempt():
+    node = FlakyNode(max_retries=2)
+    node.set_params({"concurrency": 4})
+
+    assert node._exec(list(range(5))) == ["fallback"] * 5
+    assert set(node.attempts.values()) == {2}
+
+
+def test_sequential_without_concurrency():
+    node = FlakyNode(max_retries=3)
+
+    assert node._exec(["a", "b"]) == ["a", "b"]
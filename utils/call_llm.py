@@ -1,29 +1,228 @@
-from google import genai
+from abc import ABC, abstractmethod
+import hashlib
+import json
 import os
+import threading
+import time
+
+class LLMBackend(ABC):
+    """
+    Interface for the LLM behind call_llm and call_llm_stream.
+
+    Subclasses implement `generate`; `stream` defaults to yielding the
+    whole response as a single chunk.
+    """
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        """Return the full response for a prompt"""
+
+    def stream(self, prompt: str):
+        yield self.generate(prompt)
+
+class GeminiBackend(LLMBackend):
+    """
+    Google Gemini via the google-genai SDK.
+
+    Set GEMINI_BASE_URL to send requests to another server speaking the
+    Gemini API, such as utils/mock_llm_server.py.
+    """
+    def __init__(self, base_url=None):
+        self.base_url = base_url or os.getenv("GEMINI_BASE_URL")
+        self.model = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        # Created on first use: the SDK is slow to import
+        with self._lock:
+            if self._client is None:
+                from google import genai
+
+                api_key = os.getenv("GEMINI_API_KEY", "Your API Key")
+                http_options = {"base_url": self.base_url} if self.base_url else None
+                self._client = genai.Client(api_key=api_key, http_options=http_options)
+            return self._client
+
+    def generate(self, prompt: str) -> str:
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=[prompt]
+        )
+        return response.text
+
+    def stream(self, prompt: str):
+        for chunk in self.client.models.generate_content_stream(
+            model=self.model,
+            contents=[prompt]
+        ):
+            if chunk.text:
+                yield chunk.text
+
+def prompt_key(prompt: str) -> str:
+    """Key identifying a prompt in a recordings file"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+class RecordingBackend(LLMBackend):
+    """
+    Wraps another backend and appends every prompt/response pair, with its
+    latency, to a JSONL recordings file.
+    """
+    def __init__(self, backend, path):
+        self.backend = backend
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _record(self, prompt, response, latency, first_chunk_latency):
+        entry = {
+            "key": prompt_key(prompt),
+            "prompt": prompt,
+            "response": response,
+            "latency": latency,
+            "first_chunk_latency": first_chunk_latency
+        }
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def generate(self, prompt: str) -> str:
+        start = time.perf_counter()
+        response = self.backend.generate(prompt)
+        latency = time.perf_counter() - start
+        self._record(prompt, response, latency, latency)
+        return response
+
+    def stream(self, prompt: str):
+        start = time.perf_counter()
+        first_chunk_latency = None
+        chunks = []
+        try:
+            for chunk in self.backend.stream(prompt):
+                if first_chunk_latency is None:
+                    first_chunk_latency = time.perf_counter() - start
+                chunks.append(chunk)
+                yield chunk
+        except GeneratorExit:
+            # Streams closed early by the consumer are recorded as received so far
+            latency = time.perf_counter() - start
+            self._record(prompt, "".join(chunks), latency, first_chunk_latency or latency)
+            raise
+        # Errors from the wrapped backend propagate above without a recording
+        latency = time.perf_counter() - start
+        self._record(prompt, "".join(chunks), latency, first_chunk_latency or latency)
+
+class ReplayBackend(LLMBackend):
+    """
+    Serves responses from a recordings file, sleeping for the recorded
+    latency multiplied by `latency_scale` (0 disables the delay).
+    """
+    def __init__(self, path, latency_scale=1.0, chunk_size=64):
+        self.latency_scale = latency_scale
+        self.chunk_size = chunk_size
+        self.recordings = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.recordings[entry["key"]] = entry
+
+    def lookup(self, prompt: str) -> dict:
+        """Return the recording for a prompt, or raise KeyError"""
+        key = prompt_key(prompt)
+        if key not in self.recordings:
+            raise KeyError(f"No recorded response for prompt {key[:12]}")
+        return self.recordings[key]
+
+    def generate(self, prompt: str) -> str:
+        entry = self.lookup(prompt)
+        time.sleep(entry["latency"] * self.latency_scale)
+        return entry["response"]
+
+    def stream(self, prompt: str):
+        entry = self.lookup(prompt)
+        response = entry["response"]
+        chunks = [response[i:i + self.chunk_size] for i in range(0, len(response), self.chunk_size)] or [""]
+
+        # Wait for the first chunk, then spread the remaining latency evenly
+        time.sleep(entry["first_chunk_latency"] * self.latency_scale)
+        delay = max(entry["latency"] - entry["first_chunk_latency"], 0) * self.latency_scale / len(chunks)
+        for i, chunk in enumerate(chunks):
+            if i > 0:
+                time.sleep(delay)
+            yield chunk
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def create_backend() -> LLMBackend:
+    """
+    Create the backend selected by the LLM_BACKEND environment variable.
+
+    - gemini (default): call Gemini (or the server at GEMINI_BASE_URL)
+    - record: call Gemini and append every call to LLM_RECORDINGS
+    - replay: serve responses from LLM_RECORDINGS, scaling the recorded
+      latency by LLM_REPLAY_LATENCY_SCALE
+    """
+    name = os.getenv("LLM_BACKEND", "gemini")
+    recordings = os.getenv("LLM_RECORDINGS", "llm_recordings.jsonl")
+    if name == "gemini":
+        return GeminiBackend()
+    if name == "record":
+        return RecordingBackend(GeminiBackend(), recordings)
+    if name == "replay":
+        latency_scale = float(os.getenv("LLM_REPLAY_LATENCY_SCALE", "1.0"))
+        return ReplayBackend(recordings, latency_scale=latency_scale)
+    raise ValueError(f"Unknown LLM_BACKEND: {name}")
+
+def get_backend() -> LLMBackend:
+    """Return the active backend, creating it from the environment on first use"""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_backend()
+        return _backend
+
+def set_backend(backend: LLMBackend):
+    """Replace the active backend (e.g. in load tests)"""
+    global _backend
+    with _backend_lock:
+        _backend = backend
 
 def call_llm(prompt: str) -> str:
     """
-    Call Google Gemini LLM with the given prompt.
-    
+    Call the active LLM backend (Google Gemini by default) with the given prompt.
+
     Args:
         prompt (str): The prompt to send to the LLM
-        
+
     Returns:
         str: The response from the LLM
     """
-    api_key = os.getenv("GEMINI_API_KEY", "Your API Key")
-    client = genai.Client(api_key=api_key)
-    model = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
-    
-    response = client.models.generate_content(
-        model=model, 
-        contents=[prompt]
-    )
-    return response.text
+    return get_backend().generate(prompt)
+
+def call_llm_stream(prompt: str):
+    """
+    Call the active LLM backend with the given prompt and stream the response.
+
+    Closing the generator early (e.g. via `break` in the consumer)
+    abandons the underlying stream, so no further tokens are generated.
+
+    Args:
+        prompt (str): The prompt to send to the LLM
+
+    Yields:
+        str: Text chunks of the response as they arrive
+    """
+    yield from get_backend().stream(prompt)
 
 if __name__ == "__main__":
     test_prompt = "Hello, how are you?"
-    
+
     print("Making call...")
     response = call_llm(test_prompt)
-    print(f"Response: {response}")
\ No newline at end of file
+    print(f"Response: {response}")
+
+    print("Making streaming call...")
+    for text in call_llm_stream(test_prompt):
+        print(text, end="", flush=True)
+    print()
\ No newline at end of file
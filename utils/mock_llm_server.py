@@ -0,0 +1,104 @@
+import argparse
+import json
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+try:
+    from utils.call_llm import ReplayBackend
+except ImportError:
+    # Run as a script (python utils/mock_llm_server.py), so utils/ is on sys.path
+    from call_llm import ReplayBackend
+
+# POST /{version}/models/{model}:generateContent or :streamGenerateContent
+GEMINI_PATH = re.compile(r"^/[^/]+/models/[^/:]+:(generateContent|streamGenerateContent)(\?.*)?$")
+
+def make_handler(backend):
+    """Create a request handler serving Gemini API calls from `backend`"""
+
+    class GeminiHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            match = GEMINI_PATH.match(self.path)
+            if not match:
+                return self.send_error_json(404, "NOT_FOUND", f"Unknown path: {self.path}")
+
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            prompt = "".join(
+                part.get("text", "")
+                for content in body.get("contents", [])
+                for part in content.get("parts", [])
+            )
+
+            try:
+                if match.group(1) == "generateContent":
+                    self.send_json(200, self.candidate(backend.generate(prompt), finished=True))
+                else:
+                    self.send_stream(backend.stream(prompt))
+            except KeyError as e:
+                self.send_error_json(404, "NOT_FOUND", e.args[0])
+
+        def candidate(self, text, finished):
+            result = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+            if finished:
+                result["finishReason"] = "STOP"
+            return {"candidates": [result]}
+
+        def send_json(self, status, payload):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def send_error_json(self, status, reason, message):
+            self.send_json(status, {"error": {"code": status, "message": message, "status": reason}})
+
+        def send_stream(self, chunks):
+            # Pull the first chunk before sending headers so unknown prompts still get a 404
+            chunks = iter(chunks)
+            first = next(chunks, "")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            pending = first
+            for chunk in chunks:
+                self.write_event(self.candidate(pending, finished=False))
+                pending = chunk
+            self.write_event(self.candidate(pending, finished=True))
+
+        def write_event(self, payload):
+            self.wfile.write(f"data: {json.dumps(payload)}\r\n\r\n".encode("utf-8"))
+            self.wfile.flush()
+
+        def log_message(self, format, *args):
+            # Keep the console quiet under load
+            pass
+
+    return GeminiHandler
+
+def serve(recordings, host="127.0.0.1", port=8765, latency_scale=1.0):
+    """Serve recorded responses over the Gemini REST API until interrupted"""
+    backend = ReplayBackend(recordings, latency_scale=latency_scale)
+    server = ThreadingHTTPServer((host, port), make_handler(backend))
+    print(f"Serving {len(backend.recordings)} recorded responses on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the Gemini API, replaying recorded responses.")
+    parser.add_argument("--recordings", default="llm_recordings.jsonl",
+                        help="JSONL file written by LLM_BACKEND=record (default: llm_recordings.jsonl)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Multiplier for recorded latency; 0 answers immediately (default: 1.0)")
+    args = parser.parse_args()
+    serve(args.recordings, args.host, args.port, args.latency_scale)
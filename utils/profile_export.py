@@ -0,0 +1,122 @@
+import json
+import numpy as np
+
+# Columns of the per-column profile table: (column, profile section, key, arrow type)
+COLUMN_PROFILE_FIELDS = [
+    ("description", "column_descriptions", "description", "string"),
+    ("suggested_name", "column_descriptions", "suggested_name", "string"),
+    ("current_type", "data_types", "current_type", "string"),
+    ("suggested_type", "data_types", "suggested_type", "string"),
+    ("type_reason", "data_types", "reason", "string"),
+    ("missing_count", "missing_values", "count", "int64"),
+    ("missing_percentage", "missing_values", "percentage", "float64"),
+    ("missing_is_meaningful", "missing_values", "is_meaningful", "bool_"),
+    ("missing_reason", "missing_values", "reason", "string"),
+    ("unique_count", "uniqueness", "unique_count", "int64"),
+    ("unique_percentage", "uniqueness", "unique_percentage", "float64"),
+    ("is_candidate_key", "uniqueness", "is_candidate_key", "bool_"),
+    ("key_explanation", "uniqueness", "explanation", "string"),
+    ("has_unusual", "unusual_values", "has_unusual", "bool_"),
+    ("unusual_explanation", "unusual_values", "explanation", "string")
+]
+
+def to_native(value):
+    """
+    Convert numpy values in a profile to native Python types.
+
+    Args:
+        value: A profile value, possibly a nested dict or list
+
+    Returns:
+        The same structure containing only native Python types
+    """
+    if isinstance(value, dict):
+        return {str(k): to_native(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_native(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _json_default(value):
+    """Fallback for values the json module can't encode natively"""
+    native = to_native(value)
+    if native is value:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return native
+
+def write_profile_json(profile_results, path):
+    """
+    Write the full profile as compact JSON.
+
+    The document is encoded and written piece by piece, so no second copy
+    of the profile is built in memory.
+
+    Args:
+        profile_results (dict): shared["profile_results"]
+        path (str): Output file path
+    """
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_json_default)
+    with open(path, "w", encoding="utf-8") as f:
+        for piece in encoder.iterencode(profile_results):
+            f.write(piece)
+
+def iter_column_rows(profile_results, table_name=None):
+    """
+    Yield one flat row per profiled column.
+
+    Args:
+        profile_results (dict): shared["profile_results"]
+        table_name (str): Value for the "table" field of every row
+
+    Yields:
+        dict: The column name, table name and every COLUMN_PROFILE_FIELDS
+        entry (None when the analysis didn't run)
+    """
+    # Collect column names, starting with the sections that keep DataFrame order
+    columns = {}
+    for section in ["uniqueness", "data_types", "unusual_values", "missing_values", "column_descriptions"]:
+        for col in profile_results.get(section, {}):
+            columns.setdefault(col, None)
+
+    for col in columns:
+        row = {"table": table_name, "column": str(col)}
+        for name, section, key, _ in COLUMN_PROFILE_FIELDS:
+            row[name] = to_native(profile_results.get(section, {}).get(col, {}).get(key))
+        yield row
+
+def write_profile_parquet(profile_results, path, table_name=None, batch_size=1000):
+    """
+    Write the per-column profile as a Parquet table with one row per column.
+
+    Rows are written in batches of `batch_size`, so very wide tables never
+    need the whole profile table in memory. Requires pyarrow.
+
+    Args:
+        profile_results (dict): shared["profile_results"]
+        path (str): Output file path
+        table_name (str): Value for the "table" column of every row
+        batch_size (int): Number of rows per written batch
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet output requires pyarrow: pip install pyarrow") from e
+
+    schema = pa.schema(
+        [("table", pa.string()), ("column", pa.string())] +
+        [(name, getattr(pa, arrow_type)()) for name, _, _, arrow_type in COLUMN_PROFILE_FIELDS]
+    )
+
+    with pq.ParquetWriter(path, schema) as writer:
+        batch = []
+        for row in iter_column_rows(profile_results, table_name):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))